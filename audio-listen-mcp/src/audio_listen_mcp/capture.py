@@ -7,26 +7,58 @@ import logging
 import math
 import os
 import re
+import shutil
 import struct
 import tempfile
-import wave
+
+import numpy as np
 
 from .config import ListenConfig
 
 logger = logging.getLogger(__name__)
 
+_AUDIO_DEVICES_HEADER = b"AVFoundation audio devices:"
+# Lines look like: [AVFoundation indev @ 0x...] [0] MacBook Air Microphone
+_DEVICE_RE = re.compile(rb"\[(\d+)\][ \t]+(.+?)[ \t\r]*$", re.MULTILINE)
+
+
+def _sum_squares(samples: np.ndarray, scratch: np.ndarray) -> int:
+    """Return the sum of squared int16 samples.
+
+    Squares are computed in int64 into scratch (at least len(samples) long,
+    reused across calls): a single 16-bit square fits in int32, but a
+    chunk's worth of them does not.
+    """
+    squares = np.multiply(
+        samples, samples, out=scratch[:len(samples)], dtype=np.int64
+    )
+    return int(squares.sum())
+
+
+def _wav_header(n_pcm_bytes: int, sample_rate: int) -> bytes:
+    """Return the 44-byte RIFF header for 16-bit mono PCM."""
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + n_pcm_bytes, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", n_pcm_bytes,
+    )
+
 
 class AudioCapture:
     """Captures audio from the local microphone via ffmpeg."""
 
     def __init__(self, config: ListenConfig) -> None:
         self._config = config
+        # Resolve once so each recording skips the PATH search
+        self._ffmpeg = shutil.which("ffmpeg") or "ffmpeg"
 
-    async def record(self, duration: int) -> str:
+    async def record(self, duration: int) -> tuple[str, int]:
         """Record audio from the microphone for the given duration.
 
-        Returns the path to the recorded WAV file. The caller is responsible
-        for deleting the file after use.
+        Returns the path to the recorded WAV file and the number of PCM
+        bytes it holds. The caller is responsible for deleting the file
+        after use.
         """
         fd, wav_path = tempfile.mkstemp(suffix=".wav")
         os.close(fd)
@@ -36,8 +68,9 @@ class AudioCapture:
             device = f":{device}"
 
         cmd = [
-            "ffmpeg",
+            self._ffmpeg,
             "-y",
+            "-loglevel", "error",  # only errors on stderr, no progress spam
             "-f", "avfoundation",
             "-i", device,
             "-acodec", "pcm_s16le",
@@ -65,33 +98,68 @@ class AudioCapture:
             raise RuntimeError(f"ffmpeg recording failed (exit {proc.returncode}): {error_msg}")
 
         logger.info("Recorded to %s", wav_path)
-        return wav_path
+        return wav_path, duration * self._config.sample_rate * 2
 
     async def record_with_vad(
         self,
         max_duration: int,
         silence_duration: float,
         silence_threshold: int,
-    ) -> str:
+    ) -> tuple[str, int]:
         """Record audio with Voice Activity Detection.
 
         Starts recording and waits for speech. Once speech is detected,
         recording continues until silence persists for `silence_duration`
         seconds, then stops automatically.
 
-        Returns the path to the recorded WAV file.
+        Returns the path to the recorded WAV file and the number of PCM
+        bytes it holds.
+        """
+        pcm = await self.record_pcm_with_vad(
+            max_duration, silence_duration, silence_threshold
+        )
+        sample_rate = self._config.sample_rate
+
+        # Write collected PCM data as WAV; the size is known up front, so the
+        # header is written once instead of being patched afterwards
+        fd, wav_path = tempfile.mkstemp(suffix=".wav")
+        with os.fdopen(fd, "wb") as f:
+            f.write(_wav_header(pcm.nbytes, sample_rate))
+            f.write(pcm)
+
+        logger.info("Wrote %.1fs to %s", len(pcm) / sample_rate, wav_path)
+        return wav_path, pcm.nbytes
+
+    async def record_pcm_with_vad(
+        self,
+        max_duration: int,
+        silence_duration: float,
+        silence_threshold: int,
+    ) -> np.ndarray:
+        """Record audio with Voice Activity Detection, keeping it in memory.
+
+        Same stopping rule as `record_with_vad`, but returns the captured
+        samples as an int16 array instead of writing a WAV file.
         """
         device = self._config.audio_device or ":0"
         if not device.startswith(":"):
             device = f":{device}"
 
+        loop = asyncio.get_running_loop()
         sample_rate = self._config.sample_rate
-        chunk_duration = 0.1  # 100ms chunks
+        chunk_duration = 0.2  # 200ms chunks
         chunk_bytes = int(sample_rate * 2 * chunk_duration)  # 16bit mono
+        threshold_sq = silence_threshold * silence_threshold
 
+        # Energy detection stays on our side of the pipe rather than using
+        # ffmpeg's silencedetect filter: we need the PCM in memory anyway, the
+        # per-chunk check is one vectorised square into a reused int64
+        # buffer plus a sum, and the filter only reports silence, not the
+        # "wait for speech first" condition.
         cmd = [
-            "ffmpeg",
+            self._ffmpeg,
             "-y",
+            "-loglevel", "error",  # only errors on stderr, no progress spam
             "-f", "avfoundation",
             "-i", device,
             "-acodec", "pcm_s16le",
@@ -113,36 +181,51 @@ class AudioCapture:
             stderr=asyncio.subprocess.PIPE,
         )
 
-        audio_chunks: list[bytes] = []
+        # Preallocate the whole recording; each chunk is copied in place and
+        # analysed through a view, with its squares going into a reused
+        # int64 scratch buffer instead of a fresh temporary per chunk
+        buf = np.empty(max_duration * sample_rate, dtype="<i2")
+        scratch = np.empty(chunk_bytes // 2, dtype=np.int64)
+        pos = 0  # in samples
         speech_detected = False
         silence_start: float | None = None
 
+        stdout = proc.stdout
         try:
             while True:
-                chunk = await proc.stdout.read(chunk_bytes)
+                try:
+                    chunk = await stdout.readexactly(chunk_bytes)
+                except asyncio.IncompleteReadError as e:
+                    # ffmpeg exited; keep whatever it flushed last
+                    chunk = e.partial
                 if not chunk:
                     break
 
-                audio_chunks.append(chunk)
-
-                # Calculate RMS amplitude
-                n_samples = len(chunk) // 2
+                n_samples = min(len(chunk) // 2, len(buf) - pos)
                 if n_samples == 0:
                     continue
-                samples = struct.unpack(f"<{n_samples}h", chunk[:n_samples * 2])
-                rms = math.sqrt(sum(s * s for s in samples) / n_samples)
+                samples = buf[pos:pos + n_samples]
+                samples[:] = np.frombuffer(chunk, dtype="<i2", count=n_samples)
+                pos += n_samples
+
+                # Compare the sum of squares against threshold^2 * n, which is
+                # equivalent to RMS >= threshold without the sqrt and divide
+                sum_sq = _sum_squares(samples, scratch)
 
-                if rms >= silence_threshold:
+                if sum_sq >= threshold_sq * n_samples:
                     # Speech detected
                     if not speech_detected:
-                        logger.info("Speech detected (RMS=%.0f)", rms)
+                        logger.info(
+                            "Speech detected (RMS=%.0f)", math.sqrt(sum_sq / n_samples)
+                        )
                     speech_detected = True
                     silence_start = None
                 elif speech_detected:
                     # Silence after speech
+                    now = loop.time()
                     if silence_start is None:
-                        silence_start = asyncio.get_event_loop().time()
-                    elapsed = asyncio.get_event_loop().time() - silence_start
+                        silence_start = now
+                    elapsed = now - silence_start
                     if elapsed >= silence_duration:
                         logger.info(
                             "Silence for %.1fs after speech, stopping", elapsed
@@ -153,31 +236,23 @@ class AudioCapture:
                 proc.terminate()
                 await proc.wait()
 
-        if not audio_chunks:
-            raise RuntimeError("No audio data captured")
-
-        # Write collected PCM data as WAV
-        pcm_data = b"".join(audio_chunks)
-        fd, wav_path = tempfile.mkstemp(suffix=".wav")
-        os.close(fd)
+        if pos == 0:
+            error_msg = (await proc.stderr.read()).decode(errors="replace").strip()
+            raise RuntimeError(f"No audio data captured: {error_msg}")
 
-        with wave.open(wav_path, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(sample_rate)
-            wf.writeframes(pcm_data)
-
-        actual_duration = len(pcm_data) / (sample_rate * 2)
-        logger.info("Recorded %.1fs to %s", actual_duration, wav_path)
-        return wav_path
+        logger.info("Recorded %.1fs", pos / sample_rate)
+        return buf[:pos]
 
     async def list_devices(self) -> list[dict[str, str]]:
         """List available audio input devices using ffmpeg avfoundation.
 
         Returns a list of dicts with 'index' and 'name' keys.
         """
+        # The device list itself is logged at info level, so only the banner
+        # can be dropped here
         cmd = [
-            "ffmpeg",
+            self._ffmpeg,
+            "-hide_banner",
             "-f", "avfoundation",
             "-list_devices", "true",
             "-i", "",
@@ -189,25 +264,16 @@ class AudioCapture:
             stderr=asyncio.subprocess.PIPE,
         )
         _, stderr = await proc.communicate()
-        output = stderr.decode(errors="replace")
-
-        devices: list[dict[str, str]] = []
-        in_audio_section = False
-
-        for line in output.splitlines():
-            if "AVFoundation audio devices:" in line:
-                in_audio_section = True
-                continue
-            if in_audio_section:
-                # Lines look like: [AVFoundation ...] [0] MacBook Air Microphone
-                match = re.search(r"\[(\d+)\]\s+(.+)$", line)
-                if match:
-                    devices.append({
-                        "index": match.group(1),
-                        "name": match.group(2).strip(),
-                    })
-                elif devices:
-                    # End of audio device section
-                    break
 
-        return devices
+        # Audio devices follow the audio header; the video section comes first
+        start = stderr.find(_AUDIO_DEVICES_HEADER)
+        if start < 0:
+            return []
+
+        return [
+            {
+                "index": match.group(1).decode(),
+                "name": match.group(2).decode(errors="replace"),
+            }
+            for match in _DEVICE_RE.finditer(stderr, start + len(_AUDIO_DEVICES_HEADER))
+        ]
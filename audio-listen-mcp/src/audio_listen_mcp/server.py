@@ -6,16 +6,19 @@ import asyncio
 import base64
 import json
 import logging
+import mmap
 import os
+from collections.abc import Awaitable, Callable
 from typing import Any
 
+import numpy as np
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
 from .capture import AudioCapture
 from .config import ListenConfig
-from .transcribe import create_engine
+from .transcribe import WHISPER_SAMPLE_RATE, WhisperEngine, create_engine
 
 logger = logging.getLogger(__name__)
 
@@ -27,19 +30,42 @@ class AudioListenMCPServer:
         self._server = Server("audio-listen-mcp")
         self._config = ListenConfig.from_env()
         self._capture = AudioCapture(self._config)
-        self._engine = None  # Lazy-loaded Whisper engine
+        self._engine: WhisperEngine | None = None
+        # Started in run() so model loading overlaps the stdio handshake
+        self._engine_task: asyncio.Task[WhisperEngine] | None = None
+        self._handlers: dict[
+            str, Callable[[dict[str, Any]], Awaitable[list[TextContent]]]
+        ] = {
+            "listen": self._handle_listen,
+            "listen_raw": self._handle_listen_raw,
+            "transcribe": self._handle_transcribe,
+            "get_audio_devices": self._handle_get_audio_devices,
+        }
         self._setup_handlers()
 
+    async def _load_engine(self) -> WhisperEngine:
+        """Create the Whisper engine and load its model off the event loop."""
+        logger.info("Loading Whisper engine...")
+        engine = await asyncio.to_thread(
+            create_engine,
+            self._config.whisper_engine,
+            self._config.whisper_model,
+        )
+        await engine.warm_up()
+        logger.info("Whisper engine ready")
+        return engine
+
     async def _ensure_engine(self) -> None:
-        """Load the Whisper engine on first use (lazy initialization)."""
+        """Wait for the Whisper engine, starting the load if not yet begun."""
         if self._engine is None:
-            logger.info("Loading Whisper engine (first use)...")
-            self._engine = await asyncio.to_thread(
-                create_engine,
-                self._config.whisper_engine,
-                self._config.whisper_model,
-            )
-            logger.info("Whisper engine ready")
+            if self._engine_task is None:
+                self._engine_task = asyncio.create_task(self._load_engine())
+            try:
+                self._engine = await self._engine_task
+            except Exception:
+                # Let the next call retry instead of re-raising a stale error
+                self._engine_task = None
+                raise
 
     def _setup_handlers(self) -> None:
         @self._server.list_tools()
@@ -143,18 +169,11 @@ class AudioListenMCPServer:
         async def call_tool(
             name: str, arguments: dict[str, Any]
         ) -> list[TextContent]:
+            handler = self._handlers.get(name)
+            if handler is None:
+                return [TextContent(type="text", text=f"Unknown tool: {name}")]
             try:
-                match name:
-                    case "listen":
-                        return await self._handle_listen(arguments)
-                    case "listen_raw":
-                        return await self._handle_listen_raw(arguments)
-                    case "transcribe":
-                        return await self._handle_transcribe(arguments)
-                    case "get_audio_devices":
-                        return await self._handle_get_audio_devices()
-                    case _:
-                        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+                return await handler(arguments)
             except Exception as e:
                 logger.exception("Error in tool %s", name)
                 return [TextContent(type="text", text=f"Error: {e!s}")]
@@ -164,8 +183,11 @@ class AudioListenMCPServer:
         duration = arguments.get("duration", self._config.default_duration)
         return max(1, min(int(duration), self._config.max_duration))
 
-    async def _record(self, arguments: dict[str, Any]) -> str:
-        """Record audio using either VAD or fixed duration."""
+    async def _record(self, arguments: dict[str, Any]) -> tuple[str, int]:
+        """Record audio using either VAD or fixed duration.
+
+        Returns the WAV path and the number of PCM bytes recorded.
+        """
         duration = self._clamp_duration(arguments)
         auto_stop = arguments.get("auto_stop", True)
 
@@ -179,7 +201,13 @@ class AudioListenMCPServer:
 
     async def _handle_listen(self, arguments: dict[str, Any]) -> list[TextContent]:
         """Record audio and return transcription."""
-        audio_path = await self._record(arguments)
+        if (
+            arguments.get("auto_stop", True)
+            and self._config.sample_rate == WHISPER_SAMPLE_RATE
+        ):
+            return await self._handle_listen_in_memory(arguments)
+
+        audio_path, n_pcm_bytes = await self._record(arguments)
         try:
             # Transcribe
             await self._ensure_engine()
@@ -190,7 +218,7 @@ class AudioListenMCPServer:
                 TextContent(
                     type="text",
                     text=(
-                        f"録音: {os.path.getsize(audio_path) / (self._config.sample_rate * 2):.1f}秒\n"
+                        f"録音: {n_pcm_bytes / (self._config.sample_rate * 2):.1f}秒\n"
                         f"--- 聞こえた内容 ---\n{transcript}"
                     ),
                 )
@@ -201,21 +229,50 @@ class AudioListenMCPServer:
             except OSError:
                 pass
 
+    async def _handle_listen_in_memory(
+        self, arguments: dict[str, Any]
+    ) -> list[TextContent]:
+        """Record with VAD and hand the samples to Whisper without a WAV file."""
+        pcm = await self._capture.record_pcm_with_vad(
+            max_duration=self._clamp_duration(arguments),
+            silence_duration=self._config.vad_silence_duration,
+            silence_threshold=self._config.vad_silence_threshold,
+        )
+        audio = pcm.astype(np.float32)
+        audio /= 32768.0
+
+        await self._ensure_engine()
+        transcript = await self._engine.transcribe(audio, self._config.language)
+        return [
+            TextContent(
+                type="text",
+                text=(
+                    f"録音: {len(pcm) / self._config.sample_rate:.1f}秒\n"
+                    f"--- 聞こえた内容 ---\n{transcript}"
+                ),
+            )
+        ]
+
     async def _handle_listen_raw(self, arguments: dict[str, Any]) -> list[TextContent]:
         """Record audio and return raw WAV as base64."""
-        audio_path = await self._record(arguments)
+        audio_path, n_pcm_bytes = await self._record(arguments)
         try:
-            with open(audio_path, "rb") as f:
-                wav_data = f.read()
-            encoded = base64.b64encode(wav_data).decode("ascii")
+            # Encode straight from the page cache mapping; the raw WAV is
+            # never copied into a Python bytes object
+            with (
+                open(audio_path, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            ):
+                encoded = base64.b64encode(mm)
+                wav_size = len(mm)
             return [
                 TextContent(
                     type="text",
                     text=(
-                        f"録音: {os.path.getsize(audio_path) / (self._config.sample_rate * 2):.1f}秒\n"
+                        f"録音: {n_pcm_bytes / (self._config.sample_rate * 2):.1f}秒\n"
                         f"フォーマット: WAV (PCM S16LE, {self._config.sample_rate}Hz, mono)\n"
-                        f"サイズ: {len(wav_data)} bytes\n"
-                        f"--- base64 ---\n{encoded}"
+                        f"サイズ: {wav_size} bytes\n"
+                        f"--- base64 ---\n{encoded.decode('ascii')}"
                     ),
                 )
             ]
@@ -248,7 +305,9 @@ class AudioListenMCPServer:
             )
         ]
 
-    async def _handle_get_audio_devices(self) -> list[TextContent]:
+    async def _handle_get_audio_devices(
+        self, arguments: dict[str, Any]
+    ) -> list[TextContent]:
         """List available audio input devices."""
         devices = await self._capture.list_devices()
         if not devices:
@@ -271,6 +330,8 @@ class AudioListenMCPServer:
 
     async def run(self) -> None:
         """Start the MCP server using stdio transport."""
+        self._engine_task = asyncio.create_task(self._load_engine())
+        self._engine_task.add_done_callback(_log_engine_failure)
         async with stdio_server() as (read_stream, write_stream):
             await self._server.run(
                 read_stream,
@@ -279,6 +340,12 @@ class AudioListenMCPServer:
             )
 
 
+def _log_engine_failure(task: asyncio.Task[WhisperEngine]) -> None:
+    """Log a failed start-up load; the next tool call retries and reports it."""
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        logger.error("Whisper engine failed to load", exc_info=exc)
+
+
 def main() -> None:
     """Entry point for the audio-listen-mcp server."""
     logging.basicConfig(
@@ -3,23 +3,53 @@
 from __future__ import annotations
 
 import asyncio
+import importlib
+import importlib.util
 import logging
+import os
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Whisper models expect 16 kHz mono input
+WHISPER_SAMPLE_RATE = 16000
+
+# Backend module per engine, probed once so create_engine only imports the
+# engine it picks instead of unwinding failed imports along the fallback chain
+_ENGINE_MODULES = {
+    "mlx": "mlx_whisper",
+    "faster": "faster_whisper",
+    "pytorch": "whisper",
+}
+_ENGINE_AVAILABLE = {
+    name: importlib.util.find_spec(module) is not None
+    for name, module in _ENGINE_MODULES.items()
+}
+
+
+def _describe(audio: str | np.ndarray) -> str:
+    """Describe the transcription input for log messages."""
+    if isinstance(audio, str):
+        return audio
+    return f"{len(audio) / WHISPER_SAMPLE_RATE:.1f}s of in-memory audio"
+
 
 class WhisperEngine(ABC):
     """Abstract base class for Whisper transcription engines."""
 
     @abstractmethod
-    async def transcribe(self, audio_path: str, language: str) -> str:
-        """Transcribe the audio file at the given path.
+    async def transcribe(self, audio: str | np.ndarray, language: str) -> str:
+        """Transcribe an audio file path or float32 16 kHz mono samples.
 
         Returns the transcribed text.
         """
         ...
 
+    async def warm_up(self) -> None:
+        """Load the model ahead of the first transcription (optional)."""
+
 
 class MLXWhisperEngine(WhisperEngine):
     """Whisper engine using mlx-whisper (Apple Silicon optimized)."""
@@ -30,13 +60,28 @@ class MLXWhisperEngine(WhisperEngine):
         self._model_path = f"mlx-community/whisper-{model_name}-mlx"
         logger.info("MLXWhisperEngine initialized with model: %s", self._model_path)
 
-    async def transcribe(self, audio_path: str, language: str) -> str:
+    async def warm_up(self) -> None:
         import mlx_whisper
 
-        logger.info("Transcribing %s with mlx-whisper", audio_path)
+        # mlx-whisper loads and caches the model inside transcribe(); run it
+        # once on a second of silence so the first real request skips that
+        logger.info("Loading mlx-whisper model: %s", self._model_path)
+        await asyncio.to_thread(
+            mlx_whisper.transcribe,
+            np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32),
+            path_or_hf_repo=self._model_path,
+            # A fixed language skips the detection pass
+            language="en",
+        )
+        logger.info("mlx-whisper model loaded")
+
+    async def transcribe(self, audio: str | np.ndarray, language: str) -> str:
+        import mlx_whisper
+
+        logger.info("Transcribing %s with mlx-whisper", _describe(audio))
         result = await asyncio.to_thread(
             mlx_whisper.transcribe,
-            audio_path,
+            audio,
             path_or_hf_repo=self._model_path,
             language=language,
         )
@@ -62,18 +107,61 @@ class PyTorchWhisperEngine(WhisperEngine):
             )
             logger.info("PyTorch Whisper model loaded")
 
-    async def transcribe(self, audio_path: str, language: str) -> str:
+    async def warm_up(self) -> None:
         await self._ensure_model()
 
-        logger.info("Transcribing %s with PyTorch Whisper", audio_path)
+    async def transcribe(self, audio: str | np.ndarray, language: str) -> str:
+        await self._ensure_model()
+
+        logger.info("Transcribing %s with PyTorch Whisper", _describe(audio))
         result = await asyncio.to_thread(
-            self._model.transcribe, audio_path, language=language
+            self._model.transcribe, audio, language=language
         )
         text = result.get("text", "").strip()
         logger.info("Transcription result: %s", text[:100])
         return text
 
 
+class FasterWhisperEngine(WhisperEngine):
+    """Whisper engine using faster-whisper (CTranslate2, int8 on CPU)."""
+
+    def __init__(self, model_name: str) -> None:
+        self._model_name = model_name
+        self._model = None
+
+    async def _ensure_model(self) -> None:
+        if self._model is None:
+            from faster_whisper import WhisperModel
+
+            logger.info("Loading faster-whisper model: %s", self._model_name)
+            self._model = await asyncio.to_thread(
+                WhisperModel,
+                self._model_name,
+                compute_type="int8",
+                cpu_threads=os.cpu_count() or 0,
+            )
+            logger.info("faster-whisper model loaded")
+
+    async def warm_up(self) -> None:
+        await self._ensure_model()
+
+    def _transcribe_sync(self, audio: str | np.ndarray, language: str) -> str:
+        # Segments are decoded lazily while the generator is consumed
+        segments, _ = self._model.transcribe(
+            audio, language=language, vad_filter=True
+        )
+        return "".join(segment.text for segment in segments)
+
+    async def transcribe(self, audio: str | np.ndarray, language: str) -> str:
+        await self._ensure_model()
+
+        logger.info("Transcribing %s with faster-whisper", _describe(audio))
+        text = await asyncio.to_thread(self._transcribe_sync, audio, language)
+        text = text.strip()
+        logger.info("Transcription result: %s", text[:100])
+        return text
+
+
 def create_engine(engine_name: str, model_name: str) -> WhisperEngine:
     """Create a Whisper engine instance with graceful fallback.
 
@@ -82,37 +170,46 @@ def create_engine(engine_name: str, model_name: str) -> WhisperEngine:
     errors: list[str] = []
 
     # Determine engine order based on preference
+    mlx = ("mlx", MLXWhisperEngine)
+    faster = ("faster", FasterWhisperEngine)
+    pytorch = ("pytorch", PyTorchWhisperEngine)
     if engine_name == "mlx":
-        engine_order = [("mlx", MLXWhisperEngine), ("pytorch", PyTorchWhisperEngine)]
+        engine_order = [mlx, faster, pytorch]
+    elif engine_name == "faster":
+        engine_order = [faster, mlx, pytorch]
     elif engine_name == "pytorch":
-        engine_order = [("pytorch", PyTorchWhisperEngine), ("mlx", MLXWhisperEngine)]
+        engine_order = [pytorch, mlx, faster]
     else:
-        engine_order = [("mlx", MLXWhisperEngine), ("pytorch", PyTorchWhisperEngine)]
+        engine_order = [mlx, faster, pytorch]
         errors.append(f"Unknown engine '{engine_name}', trying available engines")
 
     for name, engine_cls in engine_order:
+        module_name = _ENGINE_MODULES[name]
+        if not _ENGINE_AVAILABLE[name]:
+            errors.append(f"{name}: No module named '{module_name}'")
+            logger.debug("Engine '%s' not installed", name)
+            continue
         try:
-            engine = engine_cls(model_name)
-            # Verify the engine's dependencies are importable
-            if name == "mlx":
-                import mlx_whisper  # noqa: F401
-            elif name == "pytorch":
-                import whisper  # noqa: F401
-            if name != engine_name:
-                logger.warning(
-                    "Requested engine '%s' unavailable, using '%s' instead",
-                    engine_name, name,
-                )
-            else:
-                logger.info("Using Whisper engine: %s", name)
-            return engine
+            # Verify the engine's dependencies actually import
+            importlib.import_module(module_name)
         except ImportError as e:
             errors.append(f"{name}: {e}")
             logger.debug("Engine '%s' not available: %s", name, e)
+            continue
+
+        if name != engine_name:
+            logger.warning(
+                "Requested engine '%s' unavailable, using '%s' instead",
+                engine_name, name,
+            )
+        else:
+            logger.info("Using Whisper engine: %s", name)
+        return engine_cls(model_name)
 
     raise ImportError(
         "No Whisper engine available. Install one of:\n"
         "  pip install mlx-whisper    (recommended for Apple Silicon)\n"
+        "  pip install faster-whisper (CTranslate2, int8 on CPU)\n"
         "  pip install openai-whisper (PyTorch, slower)\n"
         f"\nDetailed errors:\n" + "\n".join(f"  - {e}" for e in errors)
     )
@@ -0,0 +1,115 @@
+"""Audio file playback through a long-lived mpv process."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+
+class MpvPlayer:
+    """Plays audio files through one idle mpv instance driven over JSON IPC.
+
+    Spawning mpv per utterance pays process start-up and audio device setup
+    every time; this keeps a single process and sends it `loadfile` commands.
+    mpv is started on first use and restarted if it has exited.
+    """
+
+    def __init__(self, mpv_path: str = "mpv") -> None:
+        self._mpv_path = mpv_path
+        self._socket_path = os.path.join(
+            tempfile.gettempdir(), f"audio-speak-mpv-{os.getpid()}-{id(self)}.sock"
+        )
+        self._proc: asyncio.subprocess.Process | None = None
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
+
+    async def _ensure_started(self) -> None:
+        if self._proc is not None and self._proc.returncode is None:
+            return
+        self._kill()
+
+        logger.info("Starting mpv (IPC socket %s)", self._socket_path)
+        self._proc = await asyncio.create_subprocess_exec(
+            self._mpv_path,
+            "--idle=yes",
+            "--no-video",
+            "--no-terminal",
+            "--really-quiet",
+            f"--input-ipc-server={self._socket_path}",
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+
+        # mpv creates the socket shortly after it starts
+        for _ in range(100):
+            try:
+                self._reader, self._writer = await asyncio.open_unix_connection(
+                    self._socket_path
+                )
+                return
+            except (FileNotFoundError, ConnectionRefusedError):
+                if self._proc.returncode is not None:
+                    break
+                await asyncio.sleep(0.05)
+        self._kill()
+        raise RuntimeError("could not connect to the mpv IPC socket")
+
+    def _kill(self) -> None:
+        """Drop the connection and stop mpv if it is still running."""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+        if self._proc is not None and self._proc.returncode is None:
+            self._proc.kill()
+        self._proc = None
+        try:
+            os.unlink(self._socket_path)
+        except OSError:
+            pass
+
+    async def play(self, path: str) -> None:
+        """Play the file at path and return once playback has finished.
+
+        Raises RuntimeError if mpv cannot play the file or exits meanwhile.
+        """
+        async with self._lock:
+            await self._ensure_started()
+            try:
+                command = {"command": ["loadfile", path]}
+                self._writer.write(json.dumps(command).encode("utf-8") + b"\n")
+                await self._writer.drain()
+
+                while True:
+                    line = await self._reader.readline()
+                    if not line:
+                        raise RuntimeError("mpv exited during playback")
+                    message = json.loads(line)
+                    error = message.get("error")
+                    if error is not None and error != "success":
+                        raise RuntimeError(f"mpv: {error}")
+                    if message.get("event") == "end-file":
+                        if message.get("reason") == "error":
+                            raise RuntimeError(
+                                f"mpv: {message.get('file_error', 'playback error')}"
+                            )
+                        return
+            except BaseException:
+                # The connection may hold a half-read reply or a pending
+                # end-file event; start from a fresh process next time
+                self._kill()
+                raise
+
+    async def close(self) -> None:
+        """Stop the mpv process."""
+        async with self._lock:
+            if self._proc is not None and self._proc.returncode is None:
+                self._proc.terminate()
+                await self._proc.wait()
+            self._kill()
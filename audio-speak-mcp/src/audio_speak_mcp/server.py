@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from mcp.server import Server
@@ -16,11 +17,30 @@ from .tts import TTSEngine, create_engine
 logger = logging.getLogger(__name__)
 
 
+def _format_voice(v: dict[str, str]) -> str:
+    """One get_voices line: name [lang]  (id: ...)  — sample, skipping empty fields."""
+    language = v.get("language")
+    voice_id = v.get("voice_id")
+    sample = v.get("sample")
+    parts = (
+        v.get("name", ""),
+        language and f"[{language}]",
+        voice_id and f"(id: {voice_id})",
+        sample and f"— {sample}",
+    )
+    return "  ".join(p for p in parts if p)
+
+
 class AudioSpeakMCPServer:
     def __init__(self) -> None:
         self._server = Server("audio-speak-mcp")
         self._config = SpeakConfig.from_env()
         self._engine: TTSEngine | None = None
+        self._warm_up_task: asyncio.Task[None] | None = None
+        # Blocking engine work (model load, synthesis, downloads) runs through
+        # asyncio.to_thread; one worker keeps Kokoro generations serialised
+        # on a single warm thread instead of spreading over a large pool
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
         self._setup_handlers()
 
     def _ensure_engine(self) -> TTSEngine:
@@ -29,43 +49,46 @@ class AudioSpeakMCPServer:
         return self._engine
 
     def _setup_handlers(self) -> None:
-        @self._server.list_tools()
-        async def list_tools() -> list[Tool]:
-            return [
-                Tool(
-                    name="say",
-                    description=(
-                        "テキストを声に出して話す。ユーザーに音声で伝えたいときに使う。"
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "text": {
-                                "type": "string",
-                                "description": "発話するテキスト",
-                            },
-                            "voice": {
-                                "type": "string",
-                                "description": "使用する音声名（省略時はデフォルト音声）",
-                            },
-                            "rate": {
-                                "type": "integer",
-                                "description": "発話速度（words per minute）。省略時はデフォルト速度",
-                            },
-                        },
-                        "required": ["text"],
-                    },
+        # The tool list does not depend on the request; build it once
+        tools = [
+            Tool(
+                name="say",
+                description=(
+                    "テキストを声に出して話す。ユーザーに音声で伝えたいときに使う。"
                 ),
-                Tool(
-                    name="get_voices",
-                    description="利用可能な音声の一覧を取得する。",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": [],
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "text": {
+                            "type": "string",
+                            "description": "発話するテキスト",
+                        },
+                        "voice": {
+                            "type": "string",
+                            "description": "使用する音声名（省略時はデフォルト音声）",
+                        },
+                        "rate": {
+                            "type": "integer",
+                            "description": "発話速度（words per minute）。省略時はデフォルト速度",
+                        },
                     },
-                ),
-            ]
+                    "required": ["text"],
+                },
+            ),
+            Tool(
+                name="get_voices",
+                description="利用可能な音声の一覧を取得する。",
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                    "required": [],
+                },
+            ),
+        ]
+
+        @self._server.list_tools()
+        async def list_tools() -> list[Tool]:
+            return tools
 
         @self._server.call_tool()
         async def call_tool(
@@ -102,20 +125,9 @@ class AudioSpeakMCPServer:
                                 type="text",
                                 text="利用可能な音声が見つかりませんでした。",
                             )]
-                        lines = [
-                            f"利用可能な音声（エンジン: {self._config.tts_engine}）:",
-                            "",
-                        ]
-                        for v in voices:
-                            parts = [v.get("name", "")]
-                            if v.get("language"):
-                                parts.append(f"[{v['language']}]")
-                            if v.get("voice_id"):
-                                parts.append(f"(id: {v['voice_id']})")
-                            if v.get("sample"):
-                                parts.append(f"— {v['sample']}")
-                            lines.append("  ".join(parts))
-                        return [TextContent(type="text", text="\n".join(lines))]
+                        header = f"利用可能な音声（エンジン: {self._config.tts_engine}）:"
+                        text = "\n".join([header, "", *map(_format_voice, voices)])
+                        return [TextContent(type="text", text=text)]
 
                     case _:
                         return [TextContent(
@@ -126,13 +138,28 @@ class AudioSpeakMCPServer:
                 logger.exception("Error in tool %s", name)
                 return [TextContent(type="text", text=f"エラー: {e!s}")]
 
+    async def _warm_up(self) -> None:
+        try:
+            await self._ensure_engine().warm_up()
+        except Exception:
+            # call_tool builds the engine again and reports the error
+            logger.exception("TTS engine start-up failed")
+
     async def run(self) -> None:
-        async with stdio_server() as (read_stream, write_stream):
-            await self._server.run(
-                read_stream,
-                write_stream,
-                self._server.create_initialization_options(),
-            )
+        asyncio.get_running_loop().set_default_executor(self._executor)
+        # Load the engine's model while the MCP handshake is in progress
+        self._warm_up_task = asyncio.create_task(self._warm_up())
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self._server.run(
+                    read_stream,
+                    write_stream,
+                    self._server.create_initialization_options(),
+                )
+        finally:
+            if self._engine is not None:
+                await self._engine.close()
+            self._executor.shutdown(wait=False)
 
 
 def main() -> None:
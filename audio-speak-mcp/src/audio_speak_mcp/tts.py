@@ -3,16 +3,60 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
 import logging
+import os
+import re
 import shutil
 import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable
 from pathlib import Path
 
 from .config import SpeakConfig
+from .player import MpvPlayer
 
 logger = logging.getLogger(__name__)
 
+# One line of `say -v ?`: "Name    lang  # Sample text". Names may contain
+# spaces (e.g. "Bad News", "Eddy (English (UK))"), so the name runs up to
+# the language code rather than the first whitespace.
+# Matched on raw bytes; only the captured fields are decoded.
+_SAY_VOICE_RE = re.compile(
+    rb"^(?P<name>.+?)\s+(?P<lang>[a-z]{2,3}[_-]\w+)\s*(?:#\s*(?P<sample>.*?))?\s*$"
+)
+
+
+def _feed_fifo(fifo_path: str, chunks: Iterable[bytes]) -> None:
+    """Write chunks into a FIFO; blocks until a reader has opened it."""
+    try:
+        with open(fifo_path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+    except BrokenPipeError:
+        # The reader went away (playback stopped or failed)
+        pass
+
+
+def _remove_cache_file(path: Path) -> None:
+    """Delete a cache file; failures only cost disk space."""
+    try:
+        path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning("Could not remove cache file %s: %s", path, e)
+
+
+def _release_fifo_writer(fifo_path: str) -> None:
+    """Open and close the read end so a writer blocked in open() proceeds."""
+    try:
+        os.close(os.open(fifo_path, os.O_RDONLY | os.O_NONBLOCK))
+    except OSError:
+        pass
+
 
 class TTSEngine(ABC):
     """Abstract base class for TTS engines."""
@@ -27,6 +71,12 @@ class TTSEngine(ABC):
         """Return a list of available voices."""
         ...
 
+    async def warm_up(self) -> None:
+        """Load heavy resources ahead of the first request (optional)."""
+
+    async def close(self) -> None:
+        """Release long-lived resources such as player processes (optional)."""
+
 
 class MacOSTTSEngine(TTSEngine):
     """TTS engine using macOS built-in say command."""
@@ -34,41 +84,38 @@ class MacOSTTSEngine(TTSEngine):
     def __init__(self, default_voice: str, default_rate: int | None) -> None:
         self._default_voice = default_voice
         self._default_rate = default_rate
+        self._voices: list[dict[str, str]] | None = None
 
     async def say(self, text: str, voice: str | None = None, rate: int | None = None) -> str:
         voice = voice or self._default_voice
         rate = rate or self._default_rate
 
-        # Write text to a temp file to avoid shell injection via special characters
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False, encoding="utf-8"
-        ) as f:
-            f.write(text)
-            text_file = f.name
+        # Text goes in on stdin (say reads it when no message or -f is given),
+        # so it is never parsed as arguments
+        cmd = ["say", "-v", voice]
+        if rate is not None:
+            cmd.extend(["-r", str(rate)])
 
-        try:
-            cmd = ["say", "-v", voice]
-            if rate is not None:
-                cmd.extend(["-r", str(rate)])
-            cmd.extend(["-f", text_file])
+        logger.info("Running: %s", " ".join(cmd))
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await proc.communicate(input=text.encode("utf-8"))
 
-            logger.info("Running: %s", " ".join(cmd))
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            _, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            err = stderr.decode().strip()
+            return f"say コマンドがエラーを返しました (code {proc.returncode}): {err}"
 
-            if proc.returncode != 0:
-                err = stderr.decode().strip()
-                return f"say コマンドがエラーを返しました (code {proc.returncode}): {err}"
-
-            return f"発話完了（voice={voice}, {len(text)}文字）"
-        finally:
-            Path(text_file).unlink(missing_ok=True)
+        return f"発話完了（voice={voice}, {len(text)}文字）"
 
     async def list_voices(self) -> list[dict[str, str]]:
+        # The installed voices do not change while the server runs
+        if self._voices is not None:
+            return self._voices
+
         proc = await asyncio.create_subprocess_exec(
             "say", "-v", "?",
             stdout=asyncio.subprocess.PIPE,
@@ -77,26 +124,17 @@ class MacOSTTSEngine(TTSEngine):
         stdout, _ = await proc.communicate()
 
         voices: list[dict[str, str]] = []
-        for line in stdout.decode().splitlines():
-            # Format: "Name    lang  # Sample text"
-            if not line.strip():
-                continue
-            parts = line.split("#", 1)
-            meta = parts[0].strip()
-            sample = parts[1].strip() if len(parts) > 1 else ""
-
-            # Split meta into name and language code
-            # e.g. "Kyoko             ja_JP"
-            tokens = meta.split()
-            if len(tokens) >= 2:
-                name = tokens[0]
-                lang = tokens[1]
-            else:
-                name = meta
-                lang = ""
-
-            voices.append({"name": name, "language": lang, "sample": sample})
-
+        for line in stdout.splitlines():
+            m = _SAY_VOICE_RE.match(line)
+            if m:
+                voices.append({
+                    "name": m["name"].decode("utf-8", errors="replace"),
+                    "language": m["lang"].decode("ascii"),
+                    "sample": (m["sample"] or b"").decode("utf-8", errors="replace"),
+                })
+
+        if proc.returncode == 0:
+            self._voices = voices
         return voices
 
 
@@ -112,17 +150,34 @@ class ElevenLabsTTSEngine(TTSEngine):
         self._api_key = api_key
         self._default_voice_id = default_voice_id
         self._model_id = model_id
+        # Resolved once; the PATH lookup would otherwise run on every request
+        self._mpv = shutil.which("mpv")
+        self._player = MpvPlayer(self._mpv or "mpv")
+        self._client = None
+
+    async def close(self) -> None:
+        await self._player.close()
+
+    def _ensure_client(self):
+        # One client for the engine's lifetime so its HTTP connection pool
+        # (and TLS session) is reused across requests. Built synchronously
+        # on the event loop, so concurrent first calls cannot race.
+        if self._client is None:
+            from elevenlabs import ElevenLabs
+
+            self._client = ElevenLabs(api_key=self._api_key)
+        return self._client
 
     async def say(self, text: str, voice: str | None = None, rate: int | None = None) -> str:
         try:
-            from elevenlabs import ElevenLabs
+            client = self._ensure_client()
         except ImportError:
             return (
                 "elevenlabs パッケージがインストールされていません。"
                 "pip install elevenlabs でインストールしてください。"
             )
 
-        if not shutil.which("mpv"):
+        if not self._mpv:
             return "mpv が見つかりません。brew install mpv でインストールしてください。"
 
         voice_id = voice or self._default_voice_id
@@ -131,7 +186,6 @@ class ElevenLabsTTSEngine(TTSEngine):
 
         # Generate audio using ElevenLabs API
         try:
-            client = ElevenLabs(api_key=self._api_key)
             audio_generator = await asyncio.to_thread(
                 client.text_to_speech.convert,
                 text=text,
@@ -139,23 +193,35 @@ class ElevenLabsTTSEngine(TTSEngine):
                 model_id=self._model_id,
             )
 
-            # Write audio to temp file
-            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
-                for chunk in audio_generator:
-                    f.write(chunk)
-                audio_path = f.name
-
-            # Play with mpv
-            proc = await asyncio.create_subprocess_exec(
-                "mpv", "--no-video", "--really-quiet", audio_path,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            await proc.communicate()
-            Path(audio_path).unlink(missing_ok=True)
-
-            if proc.returncode != 0:
-                return f"mpv の再生でエラーが発生しました (code {proc.returncode})"
+            # Stream the response to mpv through a FIFO so playback starts
+            # while the rest of the audio is still downloading
+            with tempfile.TemporaryDirectory(prefix="audio-speak-") as tmp_dir:
+                fifo_path = os.path.join(tmp_dir, "speech.mp3")
+                os.mkfifo(fifo_path)
+                feeder = asyncio.create_task(
+                    asyncio.to_thread(_feed_fifo, fifo_path, audio_generator)
+                )
+                play_error: RuntimeError | None = None
+                try:
+                    await self._player.play(fifo_path)
+                except RuntimeError as e:
+                    play_error = e
+                finally:
+                    while not feeder.done():
+                        # Unblock the feeder if mpv never opened the FIFO
+                        _release_fifo_writer(fifo_path)
+                        await asyncio.wait([feeder], timeout=0.1)
+                    (feed_error,) = await asyncio.gather(
+                        feeder, return_exceptions=True
+                    )
+
+            # A failed download (bad API key, quota, unknown voice) surfaces
+            # only here, and mpv then also fails on the empty stream; report
+            # the API error rather than the playback one it caused
+            if isinstance(feed_error, Exception):
+                raise feed_error
+            if play_error is not None:
+                return f"mpv の再生でエラーが発生しました: {play_error!s}"
 
             return f"発話完了（ElevenLabs, voice_id={voice_id}, {len(text)}文字）"
         except Exception as e:
@@ -164,12 +230,11 @@ class ElevenLabsTTSEngine(TTSEngine):
 
     async def list_voices(self) -> list[dict[str, str]]:
         try:
-            from elevenlabs import ElevenLabs
+            client = self._ensure_client()
         except ImportError:
             return []
 
         try:
-            client = ElevenLabs(api_key=self._api_key)
             response = await asyncio.to_thread(client.voices.get_all)
             return [
                 {"name": v.name or "", "voice_id": v.voice_id, "language": ""}
@@ -180,9 +245,31 @@ class ElevenLabsTTSEngine(TTSEngine):
             return []
 
 
+# Voices bundled with Kokoro-82M that suit this server
+_KOKORO_VOICES: list[dict[str, str]] = [
+    {"name": "jf_alpha", "language": "ja", "sample": "こんにちは（女性・推奨）"},
+    {"name": "jf_gongitsune", "language": "ja", "sample": "こんにちは（女性）"},
+    {"name": "jf_tebukuro", "language": "ja", "sample": "こんにちは（女性）"},
+    {"name": "jf_nezumi", "language": "ja", "sample": "こんにちは（女性）"},
+    {"name": "jm_kumo", "language": "ja", "sample": "こんにちは（男性）"},
+    {"name": "af_heart", "language": "en", "sample": "Hello (Female, best English)"},
+    {"name": "af_alloy", "language": "en", "sample": "Hello (Female)"},
+    {"name": "am_adam", "language": "en", "sample": "Hello (Male)"},
+    {"name": "bf_emma", "language": "en-GB", "sample": "Hello (Female, British)"},
+    {"name": "bm_george", "language": "en-GB", "sample": "Hello (Male, British)"},
+]
+
+
 class KokoroTTSEngine(TTSEngine):
     """TTS engine using mlx-kokoro for local speech synthesis on Apple Silicon."""
 
+    # Kokoro outputs 24 kHz mono float audio
+    SAMPLE_RATE = 24000
+    # Number of synthesized utterances kept in the on-disk cache
+    CACHE_SIZE = 64
+    # Partial cache files older than this were left by an interrupted run
+    STALE_PART_SECONDS = 3600
+
     def __init__(
         self,
         default_voice: str,
@@ -195,16 +282,98 @@ class KokoroTTSEngine(TTSEngine):
         self._default_speed = default_speed
         self._default_lang_code = default_lang_code
         self._model = None
+        self._model_lock = threading.Lock()
+        # Repeated phrases are played from disk without running the model
+        self._cache_dir = Path.home() / ".cache" / "audio-speak-mcp" / "kokoro"
+        self._cache: OrderedDict[str, Path] = OrderedDict()
+        self._load_cache_index()
+        # Cache keys currently being synthesized, set once each one finishes
+        self._in_flight: dict[str, asyncio.Event] = {}
+        self._mpv = shutil.which("mpv")
+        # Cached files are played without spawning mpv each time
+        self._player = MpvPlayer(self._mpv or "mpv")
+
+    async def close(self) -> None:
+        await self._player.close()
+
+    def _cache_key(self, text: str, voice: str, speed: float) -> str:
+        key = repr((self._model_id, text, voice, speed, self._default_lang_code))
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _load_cache_index(self) -> None:
+        """Index files left by earlier runs, oldest use first, and prune.
+
+        The modification time records the last use (lookups touch it), so
+        the size limit holds across restarts, not just within one process.
+        """
+        try:
+            entries = [
+                (entry.stat().st_mtime, entry)
+                for entry in self._cache_dir.iterdir()
+            ]
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            # The cache is an optimisation; say() streams without it
+            logger.warning("Kokoro cache directory unusable: %s", e)
+            return
+
+        stale_before = time.time() - self.STALE_PART_SECONDS
+        for mtime, path in sorted(entries):
+            if path.suffix == ".wav":
+                self._cache_add(path.stem, path)
+            elif path.suffix == ".part" and mtime < stale_before:
+                _remove_cache_file(path)
+
+    def _cache_lookup(self, key: str) -> Path | None:
+        """Return the cached WAV for key, including ones written by other runs."""
+        path = self._cache.get(key) or self._cache_dir / f"{key}.wav"
+        try:
+            # Record the use so the next start keeps recently used entries
+            os.utime(path)
+        except FileNotFoundError:
+            self._cache.pop(key, None)
+            return None
+        except OSError as e:
+            logger.warning("Kokoro cache lookup failed: %s", e)
+            self._cache.pop(key, None)
+            return None
+        self._cache_add(key, path)
+        return path
+
+    def _cache_add(self, key: str, path: Path) -> None:
+        """Mark key as most recently used, evicting the oldest entries."""
+        self._cache[key] = path
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.CACHE_SIZE:
+            _, old_path = self._cache.popitem(last=False)
+            _remove_cache_file(old_path)
 
     def _ensure_model(self):
-        if self._model is None:
-            from mlx_audio.tts.utils import load_model
-
-            logger.info("Loading Kokoro model: %s", self._model_id)
-            self._model = load_model(self._model_id)
-            logger.info("Kokoro model loaded")
+        # Called from worker threads; the lock keeps warm-up and a first
+        # request from loading the model twice
+        with self._model_lock:
+            if self._model is None:
+                from mlx_audio.tts.utils import load_model
+
+                logger.info("Loading Kokoro model: %s", self._model_id)
+                self._model = load_model(self._model_id)
+                logger.info("Kokoro model loaded")
         return self._model
 
+    def _warm_up_sync(self) -> None:
+        import numpy  # noqa: F401
+        import soundfile  # noqa: F401
+
+        self._ensure_model()
+
+    async def warm_up(self) -> None:
+        try:
+            await asyncio.to_thread(self._warm_up_sync)
+        except Exception:
+            # say() reports the problem to the client on first use
+            logger.warning("Kokoro warm-up failed", exc_info=True)
+
     async def say(self, text: str, voice: str | None = None, rate: int | None = None) -> str:
         try:
             import mlx_audio  # noqa: F401
@@ -214,69 +383,175 @@ class KokoroTTSEngine(TTSEngine):
                 "pip install mlx-audio 'misaki[ja]' でインストールしてください。"
             )
 
-        if not shutil.which("mpv"):
+        if not self._mpv:
             return "mpv が見つかりません。brew install mpv でインストールしてください。"
 
         voice = voice or self._default_voice
         speed = self._default_speed
+        key = self._cache_key(text, voice, speed)
 
         try:
-            import numpy as np
-            import soundfile as sf
-
-            model = await asyncio.to_thread(self._ensure_model)
-
-            # Generate audio (may return multiple chunks for long text)
-            results = await asyncio.to_thread(
-                lambda: list(model.generate(
-                    text,
-                    voice=voice,
-                    speed=speed,
-                    lang_code=self._default_lang_code,
-                ))
-            )
-            if not results:
-                return "Kokoro: 音声の生成に失敗しました。"
+            audio_path = self._cache_lookup(key)
+            if audio_path is None and (pending := self._in_flight.get(key)):
+                # The same utterance is already being generated; wait for it
+                # and play the cached result instead of running the model twice
+                logger.info("Kokoro: waiting for in-flight synthesis of %s", key)
+                await pending.wait()
+                audio_path = self._cache_lookup(key)
+            if audio_path is None:
+                done = asyncio.Event()
+                self._in_flight[key] = done
+                try:
+                    returncode = await self._synthesize_and_play(text, voice, speed, key)
+                finally:
+                    if self._in_flight.get(key) is done:
+                        del self._in_flight[key]
+                    done.set()
+                if returncode is None:
+                    return "Kokoro: 音声の生成に失敗しました。"
+                if returncode != 0:
+                    return f"mpv の再生でエラーが発生しました (code {returncode})"
+            else:
+                logger.info("Kokoro cache hit: %s", audio_path.name)
+                try:
+                    await self._player.play(str(audio_path))
+                except RuntimeError as e:
+                    return f"mpv の再生でエラーが発生しました: {e!s}"
+
+            return f"発話完了（Kokoro, voice={voice}, {len(text)}文字）"
+        except Exception as e:
+            logger.exception("Kokoro TTS error")
+            return f"Kokoro でエラーが発生しました: {e!s}"
 
-            # Concatenate all chunks
-            chunks = [np.array(r.audio) for r in results]
-            audio_data = np.concatenate(chunks) if len(chunks) > 1 else chunks[0]
+    def _generate_into(
+        self,
+        text: str,
+        voice: str,
+        speed: float,
+        loop: asyncio.AbstractEventLoop,
+        queue: asyncio.Queue,
+        stop: threading.Event,
+    ) -> None:
+        """Run the model in a worker thread, handing each chunk to the loop.
 
-            # Write to temp wav file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                sf.write(f.name, audio_data, 24000)
-                audio_path = f.name
+        The queue receives audio arrays, then an exception if generation
+        failed, then a final None. Setting stop ends generation after the
+        current chunk.
+        """
+        try:
+            model = self._ensure_model()
+            for result in model.generate(
+                text,
+                voice=voice,
+                speed=speed,
+                lang_code=self._default_lang_code,
+            ):
+                if stop.is_set():
+                    break
+                loop.call_soon_threadsafe(queue.put_nowait, result.audio)
+        except Exception as e:
+            loop.call_soon_threadsafe(queue.put_nowait, e)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, None)
+
+    async def _synthesize_and_play(
+        self, text: str, voice: str, speed: float, key: str
+    ) -> int | None:
+        """Stream generated chunks to mpv while also writing them to the cache.
+
+        Playback starts with the first chunk instead of waiting for the whole
+        utterance. Returns mpv's exit code, or None if nothing was generated.
+        """
+        import numpy as np
+        import soundfile as sf
+
+        # Create the cache file before starting mpv and the model, so a
+        # failure here leaves nothing running. Chunks go to a partial file
+        # that is renamed last, so a cache lookup never hits it.
+        audio_path = self._cache_dir / f"{key}.wav"
+        partial_path: Path | None = None
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, partial_name = tempfile.mkstemp(
+                dir=self._cache_dir, prefix=f"{key}.", suffix=".part"
+            )
+        except OSError as e:
+            logger.warning("Kokoro cache unavailable, playing uncached: %s", e)
+        else:
+            os.close(fd)
+            partial_path = Path(partial_name)
 
-            # Play with mpv
+        try:
             proc = await asyncio.create_subprocess_exec(
-                "mpv", "--no-video", "--really-quiet", audio_path,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                self._mpv, "--no-video", "--really-quiet",
+                "--demuxer=rawaudio",
+                f"--demuxer-rawaudio-rate={self.SAMPLE_RATE}",
+                "--demuxer-rawaudio-format=floatle",
+                "--demuxer-rawaudio-channels=1",
+                "-",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
             )
-            await proc.communicate()
-            Path(audio_path).unlink(missing_ok=True)
-
-            if proc.returncode != 0:
-                return f"mpv の再生でエラーが発生しました (code {proc.returncode})"
+        except BaseException:
+            if partial_path is not None:
+                partial_path.unlink(missing_ok=True)
+            raise
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        producer = asyncio.create_task(asyncio.to_thread(
+            self._generate_into, text, voice, speed, loop, queue, stop
+        ))
+
+        n_samples = 0
+        try:
+            with (
+                sf.SoundFile(
+                    str(partial_path), mode="w", samplerate=self.SAMPLE_RATE,
+                    channels=1, format="WAV", subtype="FLOAT",
+                )
+                if partial_path is not None
+                else contextlib.nullcontext()
+            ) as out:
+                while (item := await queue.get()) is not None:
+                    if isinstance(item, Exception):
+                        raise item
+                    chunk = np.ascontiguousarray(item, dtype=np.float32)
+                    proc.stdin.write(chunk.tobytes())
+                    await proc.stdin.drain()
+                    if out is not None:
+                        out.write(chunk)
+                    n_samples += len(chunk)
+        except BaseException:
+            # Nobody reads the queue any more; don't finish the utterance
+            stop.set()
+            if partial_path is not None:
+                partial_path.unlink(missing_ok=True)
+            raise
+        finally:
+            proc.stdin.close()
+            await proc.wait()
+            await producer
 
-            return f"発話完了（Kokoro, voice={voice}, {len(text)}文字）"
-        except Exception as e:
-            logger.exception("Kokoro TTS error")
-            return f"Kokoro でエラーが発生しました: {e!s}"
+        if partial_path is not None:
+            if n_samples == 0:
+                partial_path.unlink(missing_ok=True)
+            else:
+                try:
+                    os.replace(partial_path, audio_path)
+                except OSError as e:
+                    logger.warning("Could not store Kokoro cache entry: %s", e)
+                    _remove_cache_file(partial_path)
+                else:
+                    self._cache_add(key, audio_path)
+        if n_samples == 0:
+            return None
+        return proc.returncode
 
     async def list_voices(self) -> list[dict[str, str]]:
-        return [
-            {"name": "jf_alpha", "language": "ja", "sample": "こんにちは（女性・推奨）"},
-            {"name": "jf_gongitsune", "language": "ja", "sample": "こんにちは（女性）"},
-            {"name": "jf_tebukuro", "language": "ja", "sample": "こんにちは（女性）"},
-            {"name": "jf_nezumi", "language": "ja", "sample": "こんにちは（女性）"},
-            {"name": "jm_kumo", "language": "ja", "sample": "こんにちは（男性）"},
-            {"name": "af_heart", "language": "en", "sample": "Hello (Female, best English)"},
-            {"name": "af_alloy", "language": "en", "sample": "Hello (Female)"},
-            {"name": "am_adam", "language": "en", "sample": "Hello (Male)"},
-            {"name": "bf_emma", "language": "en-GB", "sample": "Hello (Female, British)"},
-            {"name": "bm_george", "language": "en-GB", "sample": "Hello (Male, British)"},
-        ]
+        return _KOKORO_VOICES
 
 
 def create_engine(config: SpeakConfig) -> TTSEngine:
@@ -16,7 +16,6 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pyworld as pw
 import soundfile as sf
-import scipy.io.wavfile as wavfile
 
 parser = argparse.ArgumentParser(description="WORLD analysis + visualize")
 parser.add_argument("input_wav", help="入力 WAV ファイル")
@@ -30,15 +29,12 @@ output_dir.mkdir(parents=True, exist_ok=True)
 
 # --- 音声読み込み ---
 print(f"読み込み: {input_path}")
-sr, audio_raw = wavfile.read(str(input_path))
+# float64 で読み込む（WORLD が要求する形式。整数 PCM の正規化も libsndfile が行う）
+audio, sr = sf.read(str(input_path), dtype="float64", always_2d=False)
 
-# モノラル化・float64 変換（WORLD が要求する形式）
-if audio_raw.ndim > 1:
-    audio_raw = audio_raw.mean(axis=1)
-if np.issubdtype(audio_raw.dtype, np.integer):
-    audio = audio_raw.astype(np.float64) / np.iinfo(audio_raw.dtype).max
-else:
-    audio = audio_raw.astype(np.float64)
+# モノラル化
+if audio.ndim > 1:
+    audio = audio.mean(axis=1)
 
 print(f"音声: {len(audio)} サンプル, {sr} Hz, {len(audio)/sr:.2f}s")
 
@@ -63,7 +59,8 @@ sf.write(str(synth_path), audio_synth, sr)
 print(f"再合成保存: {synth_path}")
 
 # --- プロット ---
-fig, axes = plt.subplots(4, 1, figsize=(14, 10))
+fig_width, fig_dpi = 14, 150
+fig, axes = plt.subplots(4, 1, figsize=(fig_width, 10))
 fig.suptitle(f"WORLD Analysis: {input_path.name}", fontsize=12)
 
 # F0
@@ -73,8 +70,13 @@ axes[0].set_title("F0（基本周波数・ピッチ）— 無声区間は 0")
 axes[0].set_xlim([0, t[-1]])
 axes[0].grid(True, alpha=0.3)
 
-# SP（スペクトル包絡）— dB スケール
-sp_db = 10 * np.log10(sp.T + 1e-10)
+# 表示用の配列は float32 の C 連続配列にしておく（描画には十分な精度で、
+# imshow 内部での再コピーも避けられる）
+# SP（スペクトル包絡）— dB スケール（転置コピー 1 つの上でその場計算）
+sp_db = np.ascontiguousarray(sp.T, dtype=np.float32)
+sp_db += 1e-10
+np.log10(sp_db, out=sp_db)
+sp_db *= 10
 im1 = axes[1].imshow(
     sp_db, aspect="auto", origin="lower",
     extent=[0, t[-1], 0, sr / 2 / 1000],
@@ -85,8 +87,9 @@ axes[1].set_title("SP（スペクトル包絡・音色）")
 plt.colorbar(im1, ax=axes[1], label="dB", fraction=0.02, pad=0.01)
 
 # AP（非周期成分）
+ap_t = np.ascontiguousarray(ap.T, dtype=np.float32)
 im2 = axes[2].imshow(
-    ap.T, aspect="auto", origin="lower",
+    ap_t, aspect="auto", origin="lower",
     extent=[0, t[-1], 0, sr / 2 / 1000],
     cmap="hot", vmin=0, vmax=1,
 )
@@ -95,20 +98,22 @@ axes[2].set_title("AP（非周期成分・息の混じり）")
 plt.colorbar(im2, ax=axes[2], fraction=0.02, pad=0.01)
 
 # 波形比較
-orig_t = np.linspace(0, len(audio) / sr, len(audio))
-synth_t = np.linspace(0, len(audio_synth) / sr, len(audio_synth))
-axes[3].plot(orig_t, audio, alpha=0.7, label="original", linewidth=0.4, color="steelblue")
-axes[3].plot(synth_t, audio_synth, alpha=0.7, label="roundtrip", linewidth=0.4, color="orange")
+# 全サンプルを描くと数十万頂点になるので、1 ピクセルあたり 4 点程度に間引く
+stride = max(1, len(audio) // (fig_width * fig_dpi * 4))
+orig_t = np.arange(0, len(audio), stride) / sr
+synth_t = np.arange(0, len(audio_synth), stride) / sr
+axes[3].plot(orig_t, audio[::stride], alpha=0.7, label="original", linewidth=0.4, color="steelblue")
+axes[3].plot(synth_t, audio_synth[::stride], alpha=0.7, label="roundtrip", linewidth=0.4, color="orange")
 axes[3].set_ylabel("振幅")
 axes[3].set_xlabel("秒")
 axes[3].set_title("波形比較（原音 vs 再合成）")
 axes[3].legend(loc="upper right", fontsize=8)
-axes[3].set_xlim([0, max(orig_t[-1], synth_t[-1])])
+axes[3].set_xlim([0, max(len(audio), len(audio_synth)) / sr])
 axes[3].grid(True, alpha=0.3)
 
 plt.tight_layout()
 plot_path = output_dir / (input_path.stem + "_analysis.png")
-plt.savefig(str(plot_path), dpi=150, bbox_inches="tight")
+plt.savefig(str(plot_path), dpi=fig_dpi, bbox_inches="tight")
 plt.close()
 print(f"プロット保存: {plot_path}")
 print("完了。")
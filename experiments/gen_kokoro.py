@@ -29,18 +29,24 @@ import soundfile as sf
 model = load_model(args.model)
 print(f"生成中: {args.text!r}  voice={args.voice}  speed={args.speed}")
 
-results = list(model.generate(args.text, voice=args.voice, speed=args.speed, lang_code="j"))
-if not results:
-    print("ERROR: 音声が生成されませんでした。", file=sys.stderr)
-    sys.exit(1)
-
-chunks = [np.array(r.audio) for r in results]
-audio = np.concatenate(chunks) if len(chunks) > 1 else chunks[0]
-audio = audio.astype(np.float32)
-
 output_path = Path(args.output)
 output_path.parent.mkdir(parents=True, exist_ok=True)
-sf.write(str(output_path), audio, 24000)
 
-duration = len(audio) / 24000
-print(f"保存完了: {output_path}  ({len(audio)} サンプル, {duration:.2f}s, 24000 Hz)")
+# チャンクを生成順に書き出す（全体を結合してから保存しない）
+# Kokoro の出力は float32 なので、そのまま 32bit float WAV として保存する
+n_samples = 0
+with sf.SoundFile(
+    str(output_path), mode="w", samplerate=24000, channels=1, subtype="FLOAT"
+) as out:
+    for r in model.generate(args.text, voice=args.voice, speed=args.speed, lang_code="j"):
+        chunk = np.asarray(r.audio, dtype=np.float32)
+        out.write(chunk)
+        n_samples += len(chunk)
+
+if n_samples == 0:
+    output_path.unlink(missing_ok=True)
+    print("ERROR: 音声が生成されませんでした。", file=sys.stderr)
+    sys.exit(1)
+
+duration = n_samples / 24000
+print(f"保存完了: {output_path}  ({n_samples} サンプル, {duration:.2f}s, 24000 Hz)")